@@ -1,108 +1,341 @@
 # -*- coding: utf-8 -*-
 # wide_to_long_pyqt5.py
 
-import sys, re, traceback
+import datetime, os, sys, multiprocessing, queue, traceback, zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Callable, Optional, Tuple, List, Union
+from xml.etree import ElementTree
 
+import numpy as np
 import pandas as pd
-from openpyxl import load_workbook
+from openpyxl import Workbook, load_workbook
+
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # 未安装时退回 openpyxl
+    CalamineWorkbook = None
+
+try:
+    import xlsxwriter
+except ImportError:  # 未安装时退回 openpyxl 写出
+    xlsxwriter = None
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
 
 # ========= 核心数据处理 =========
-A1_REGEX = re.compile(r"^[A-Za-z]+[1-9]\d*$")
+class EmptyBlockError(ValueError):
+    """表头起点处没有可用的数据块（空表、说明页等）。"""
+
+class NotWideTableError(ValueError):
+    """有数据但不是可展开的宽表（缺 id 列或没有值列）。"""
+
+_A = ord("A")
+
+def _split_a1(s: str) -> Optional[Tuple[str, str]]:
+    # 逐字符扫描：前半段为 ASCII 字母，后半段为 ASCII 数字
+    i, n = 0, len(s)
+    while i < n and s[i].isascii() and s[i].isalpha():
+        i += 1
+    row_str = s[i:]
+    if i == 0 or not row_str.isascii() or not row_str.isdigit():
+        return None
+    return s[:i], row_str
+
+def is_a1(s: str) -> bool:
+    parts = _split_a1(s)
+    return parts is not None and parts[1][0] != "0"
 
 def a1_to_rc(a1: str) -> Tuple[int, int]:
-    m = re.fullmatch(r"([A-Za-z]+)(\d+)", a1.strip())
-    if not m:
+    parts = _split_a1(a1.strip())
+    if parts is None:
         raise ValueError(f"非法单元格地址: {a1}")
-    col_letters, row_str = m.groups()
+    col_letters, row_str = parts
     col = 0
     for ch in col_letters.upper():
-        col = col * 26 + (ord(ch) - ord('A') + 1)
+        col = col * 26 + (ord(ch) - _A + 1)
     row = int(row_str)
     return row, col
 
-def read_block_from_header(ws, header_cell: str) -> List[List[object]]:
-    start_r, start_c = a1_to_rc(header_cell)
-    max_r, max_c = ws.max_row, ws.max_column
+def _empty(v) -> bool:
+    # 只有字符串才需要 strip，数字/日期等不再先转成 str
+    return v is None or (type(v) is str and not v.strip())
 
-    data = []
-    for r in range(start_r, max_r + 1):
-        row_vals = []
-        for c in range(start_c, max_c + 1):
-            v = ws.cell(row=r, column=c).value
-            row_vals.append(v)
-        data.append(row_vals)
+_empty_ufunc = np.frompyfunc(_empty, 1, 1)
 
-    if not data:
-        raise ValueError("在指定表头处未读取到数据。")
+def _fill_block(rows, n_rows: int, n_cols: int) -> np.ndarray:
+    # 逐行写入预分配的数组，不再先攒一份 list-of-lists
+    block = np.full((max(n_rows, 0), max(n_cols, 0)), None, dtype=object)
+    for i, row in enumerate(rows):
+        block[i, :len(row)] = row
+    return block
 
-    # 去尾部全空列
-    def col_is_all_none(ci):
-        return all((row[ci] is None or str(row[ci]).strip() == "") for row in data)
+def _read_block_openpyxl(input_path: Path, sheet_name: Optional[str], start_r: int, start_c: int) -> np.ndarray:
+    wb = load_workbook(filename=str(input_path), read_only=True, data_only=True, keep_links=False, keep_vba=False)
+    try:
+        ws = wb[sheet_name] if sheet_name else wb.active
+
+        # 只读模式下依赖 <dimension> 标记，部分软件导出的文件会写成 A1:A1 或缺失
+        try:
+            dim = ws.calculate_dimension()
+        except ValueError:
+            dim = None
+        if dim in (None, "A1:A1"):
+            ws.reset_dimensions()
+            try:
+                ws.calculate_dimension(force=True)
+            except UnboundLocalError:  # openpyxl 对完全没有单元格的表会在这里出错，按空表处理
+                return _fill_block((), 0, 0)
+
+        rows = ws.iter_rows(min_row=start_r, min_col=start_c, values_only=True)
+        return _fill_block(rows, (ws.max_row or 0) - start_r + 1, (ws.max_column or 0) - start_c + 1)
+    finally:
+        wb.close()
+
+def _active_sheet_index(input_path: Path) -> int:
+    # calamine 不提供活动工作表，直接读 workbook.xml 的 activeTab（与 openpyxl 的 wb.active 一致）
+    try:
+        with zipfile.ZipFile(input_path) as zf:
+            root = ElementTree.fromstring(zf.read("xl/workbook.xml"))
+    except (zipfile.BadZipFile, KeyError, ElementTree.ParseError):
+        return 0  # .xls / .xlsb / .ods 等没有该信息，取第一张
+    view = root.find("{*}bookViews/{*}workbookView")
+    return int(view.get("activeTab", 0)) if view is not None else 0
+
+def _from_calamine(v):
+    # calamine 用 "" 表示空单元格、数字一律为 float、纯日期为 date；还原成 openpyxl 的 None / int / datetime
+    if type(v) is str:
+        return None if v == "" else v
+    if type(v) is float and v.is_integer() and abs(v) < 2 ** 53:
+        return int(v)
+    if type(v) is datetime.date:
+        return datetime.datetime(v.year, v.month, v.day)
+    return v
+
+_from_calamine_ufunc = np.frompyfunc(_from_calamine, 1, 1)
+
+def _read_block_calamine(input_path: Path, sheet_name: Optional[str], start_r: int, start_c: int) -> np.ndarray:
+    wb = CalamineWorkbook.from_path(str(input_path))
+    try:
+        sheet = (
+            wb.get_sheet_by_name(sheet_name) if sheet_name else wb.get_sheet_by_index(_active_sheet_index(input_path))
+        )
+        rows = sheet.to_python(skip_empty_area=False)
+    finally:
+        wb.close()
+    n_cols = max((len(row) for row in rows), default=0) - start_c + 1
+    if (start_r, start_c) == (1, 1):
+        # 表头在 A1（默认情形）时整张表就是数据块，省去逐行切片
+        body = rows
+    else:
+        body = (row[start_c - 1:] for row in rows[start_r - 1:])
+    block = _fill_block(body, len(rows) - start_r + 1, n_cols)
+    return _from_calamine_ufunc(block)
+
+def read_block_from_header(
+    input_path: Path, header_cell: Union[str, Tuple[int, int]], sheet_name: Optional[str] = None
+) -> np.ndarray:
+    # 界面已解析过的 (row, col) 直接使用，不再重复解析
+    start_r, start_c = a1_to_rc(header_cell) if isinstance(header_cell, str) else header_cell
+    if CalamineWorkbook is not None:
+        arr = _read_block_calamine(input_path, sheet_name, start_r, start_c)
+    else:
+        arr = _read_block_openpyxl(input_path, sheet_name, start_r, start_c)
 
-    end_c = len(data[0])
-    while end_c > 0 and col_is_all_none(end_c - 1):
-        end_c -= 1
-    data = [row[:end_c] for row in data]
+    if arr.shape[0] == 0:
+        raise EmptyBlockError("在指定表头处未读取到数据。")
+    if arr.size == 0:
+        raise EmptyBlockError("在指定表头处未读取到有效数据。")
 
-    # 去尾部全空行
-    def row_is_all_none(ri):
-        return all((v is None or str(v).strip() == "") for v in data[ri])
+    # 空单元格掩码只算一次，再按列/行归约找出尾部全空的范围
+    mask = _empty_ufunc(arr).astype(bool)
+
+    # 去尾部全空列
+    col_nonempty = np.flatnonzero(~mask.all(axis=0))
+    end_c = int(col_nonempty[-1]) + 1 if col_nonempty.size else 0
 
-    end_r = len(data)
-    while end_r > 0 and row_is_all_none(end_r - 1):
-        end_r -= 1
-    data = data[:end_r]
+    # 去尾部全空行
+    row_nonempty = np.flatnonzero(~mask[:, :end_c].all(axis=1))
+    end_r = int(row_nonempty[-1]) + 1 if row_nonempty.size else 0
+
+    if end_r == 0 or end_c == 0:
+        raise EmptyBlockError("在指定表头处未读取到有效数据。")
+    return arr[:end_r, :end_c]
+
+def _iter_long_rows(long_df: pd.DataFrame):
+    yield list(long_df.columns)
+    # 写出时空值统一为 None（空单元格），避免 NaN/NaT 写成错误值
+    cols = [c.astype(object).where(c.notna(), None) if c.hasnans else c for _, c in long_df.items()]
+    yield from zip(*cols)
+
+def _write_long_excel(long_df: pd.DataFrame, out_path: Path) -> None:
+    if xlsxwriter is None:
+        # openpyxl 只写模式同样是流式生成 XML，不在内存中保留整张表
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("long")
+        for row in _iter_long_rows(long_df):
+            ws.append(row)
+        wb.save(out_path)
+        return
+
+    # constant_memory：逐行落盘，内存占用与行数无关
+    # strings_to_urls 关闭：文本原样写出，不转成超链接（也避免超过链接数上限后单元格被丢弃）
+    wb = xlsxwriter.Workbook(str(out_path), {
+        "constant_memory": True,
+        "strings_to_urls": False,
+        "default_date_format": "yyyy-mm-dd hh:mm:ss",
+    })
+    try:
+        ws = wb.add_worksheet("long")
+        # 纯日期 / 纯时间不能套用日期时间格式，否则时间会显示成 1900-01-00 03:04:00
+        date_fmt = wb.add_format({"num_format": "yyyy-mm-dd"})
+        time_fmt = wb.add_format({"num_format": "hh:mm:ss"})
+        for r, row in enumerate(_iter_long_rows(long_df)):
+            for c, v in enumerate(row):
+                if isinstance(v, datetime.time):
+                    ws.write_datetime(r, c, v, time_fmt)
+                elif type(v) is datetime.date:
+                    ws.write_datetime(r, c, v, date_fmt)
+                else:
+                    ws.write(r, c, v)
+    finally:
+        wb.close()
+
+def list_sheet_names(input_path: Path) -> List[str]:
+    if CalamineWorkbook is not None:
+        wb = CalamineWorkbook.from_path(str(input_path))
+        try:
+            return list(wb.sheet_names)
+        finally:
+            wb.close()
+    wb = load_workbook(filename=str(input_path), read_only=True, keep_links=False, keep_vba=False)
+    try:
+        return list(wb.sheetnames)
+    finally:
+        wb.close()
+
+def _sheet_to_long(
+    input_path: Path,
+    header_cell: Union[str, Tuple[int, int]],
+    sheet_name: Optional[str],
+    id_col_name: Optional[str],
+    var_name: str,
+    value_name: str,
+    report: Callable[[int, str], None] = lambda pct, msg: None,
+) -> pd.DataFrame:
+    data_block = read_block_from_header(input_path, header_cell, sheet_name)
+    report(50, "整理数据…")
+    header = [("" if h is None else str(h).strip()) for h in data_block[0]]
+    for i, h in enumerate(header):
+        if h == "":
+            header[i] = f"col_{i+1}"
+    values = data_block[1:]
 
-    if not data or not data[0]:
-        raise ValueError("在指定表头处未读取到有效数据。")
-    return data
+    id_col = id_col_name or header[0]
+    if id_col not in header:
+        raise NotWideTableError(f"未找到 id 列: {id_col}. 当前列: {header}")
+
+    value_idx = [i for i, h in enumerate(header) if h != id_col]
+    if not value_idx:
+        raise NotWideTableError("没有可展开的数值列。")
+
+    # 直接拼出长表三列，顺序与 melt 一致（按变量列依次展开），省去中间宽表
+    id_arr = values[:, header.index(id_col)]
+    var_arr = np.array([header[i] for i in value_idx], dtype=object)
+    # 转置后按行取值列，结果本身就是连续的，ravel 不再额外复制
+    val_arr = values.T[value_idx].ravel()
+    # 纯数值的值列转成 float64，空值判断与后续写出都走定长数组而非逐个 Python 对象
+    is_numeric = pd.api.types.infer_dtype(val_arr, skipna=True) in ("integer", "floating", "mixed-integer-float")
+    if is_numeric:
+        val_arr = val_arr.astype(np.float64)
+    # 只按非空位置回取 id / 变量名，不先展开整张长表再过滤
+    pos = np.flatnonzero(~pd.isna(val_arr))
+    var_pos, row_pos = np.divmod(pos, len(id_arr))
+    val_arr = val_arr[pos]
+    # Excel 不区分整数与小数，全为整数值时按 int64 输出（与 openpyxl 读出的 int 一致）
+    if is_numeric and val_arr.size and np.abs(val_arr).max() < 2 ** 53 and (np.trunc(val_arr) == val_arr).all():
+        val_arr = val_arr.astype(np.int64)
+    # 三列都是刚分配好的新数组，直接交给 DataFrame，不再逐列复制一遍
+    return pd.DataFrame({
+        id_col: id_arr[row_pos],
+        var_name: var_arr[var_pos],
+        value_name: val_arr,
+    }, copy=False)
+
+def _all_sheets_to_long(
+    input_path: Path,
+    header_cell: Union[str, Tuple[int, int]],
+    id_col_name: Optional[str],
+    var_name: str,
+    value_name: str,
+    report: Callable[[int, str], None],
+) -> pd.DataFrame:
+    def convert(name: str) -> Tuple[Optional[pd.DataFrame], str]:
+        # 空表、说明页等不是宽表的工作表跳过，不让一张表拖垮整批
+        try:
+            return _sheet_to_long(input_path, header_cell, name, id_col_name, var_name, value_name), ""
+        except EmptyBlockError:
+            return None, "无数据"
+        except NotWideTableError as e:
+            return None, str(e)
+        except ValueError as e:
+            raise ValueError(f"工作表 {name}: {e}") from e
+
+    # 每个线程各自打开工作簿读取一张表；calamine 解析在 Rust 侧进行，多表可并行
+    names = list_sheet_names(input_path)
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(len(names), os.cpu_count() or 1) or 1) as ex:
+        futures = {ex.submit(convert, name): name for name in names}
+        for done, fut in enumerate(as_completed(futures), 1):
+            name = futures[fut]
+            results[name], reason = fut.result()
+            msg = f"工作表 {name} 完成" if results[name] is not None else f"工作表 {name} 已跳过：{reason}"
+            report(20 + 50 * done // len(names), msg)
+
+    frames = [(name, results[name]) for name in names if results[name] is not None]
+    if not any(len(df) for _, df in frames):
+        raise EmptyBlockError("所有工作表均未转换出数据（空表或不是宽表）。")
+
+    # 各表 id 列表头可能不同，统一改成同一列名后再合并
+    id_col = id_col_name or frames[0][1].columns[0]
+    sheet_col = "sheet"
+    while sheet_col in (id_col, var_name, value_name):
+        sheet_col += "_"
+    for name, df in frames:
+        df.columns = [id_col, var_name, value_name]
+        df.insert(0, sheet_col, name)
+    return pd.concat([df for _, df in frames], ignore_index=True)
 
 def wide_to_long_from_excel(
     input_path: Path,
-    header_cell: str = "A1",
+    header_cell: Union[str, Tuple[int, int]] = "A1",
     sheet_name: Optional[str] = None,
     id_col_name: Optional[str] = None,
     var_name: str = "variable",
     value_name: str = "value",
+    progress: Optional[Callable[[int, str], None]] = None,
+    all_sheets: bool = False,
 ) -> Path:
     input_path = Path(input_path)
     if not input_path.exists():
         raise FileNotFoundError(f"找不到文件: {input_path}")
+    report = progress or (lambda pct, msg: None)
 
-    wb = load_workbook(filename=str(input_path), data_only=True)
-    ws = wb[sheet_name] if sheet_name else wb.active
-
-    data_block = read_block_from_header(ws, header_cell)
-    header = [("" if h is None else str(h).strip()) for h in data_block[0]]
-    for i, h in enumerate(header):
-        if h == "":
-            header[i] = f"col_{i+1}"
-    rows = data_block[1:]
-
-    df = pd.DataFrame(rows, columns=header).dropna(how="all")
-
-    id_col = id_col_name or header[0]
-    if id_col not in df.columns:
-        raise ValueError(f"未找到 id 列: {id_col}. 当前列: {list(df.columns)}")
-
-    value_cols = [c for c in df.columns if c != id_col]
-    if not value_cols:
-        raise ValueError("没有可展开的数值列。")
-
-    long_df = df.melt(id_vars=[id_col], var_name=var_name, value_name=value_name)
-    long_df = long_df[~long_df[value_name].isna()]
+    if all_sheets:
+        long_df = _all_sheets_to_long(input_path, header_cell, id_col_name, var_name, value_name, report)
+    else:
+        long_df = _sheet_to_long(input_path, header_cell, sheet_name, id_col_name, var_name, value_name, report)
 
+    report(70, "写出结果…")
     stem, suffix = input_path.stem, input_path.suffix
     out_path = input_path.with_name(f"{stem}_long{suffix if suffix else '.xlsx'}")
 
     if suffix.lower() in [".xlsx", ".xlsm", ".xltx", ".xltm", ".xls"]:
-        with pd.ExcelWriter(out_path, engine="openpyxl") as writer:
-            long_df.to_excel(writer, index=False, sheet_name="long")
+        if suffix.lower() == ".xls":
+            # 写出的是 xlsx（OOXML）格式，沿用 .xls 扩展名 Excel 会报格式不符
+            out_path = input_path.with_name(f"{stem}_long.xlsx")
+        _write_long_excel(long_df, out_path)
     else:
         out_path = input_path.with_name(f"{stem}_long.csv")
         long_df.to_csv(out_path, index=False)
@@ -110,51 +343,104 @@ def wide_to_long_from_excel(
     return out_path
 
 
-# ========= 后台工作线程 =========
-class ConvertWorker(QtCore.QThread):
+# ========= 后台工作进程 =========
+def _convert_in_child(msg_queue, path, header_rc, sheet_name, id_col_name, var_name, value_name, all_sheets):
+    """子进程入口：解析在独立进程中进行，进度/结果通过 msg_queue 回传给界面。"""
+    def report(pct: int, msg: str):
+        msg_queue.put(("progress", pct, msg))
+
+    try:
+        report(5, "开始处理…")
+        path = Path(path)
+        if not path.exists():
+            raise FileNotFoundError(f"找不到文件: {path}")
+
+        report(20, "读取 Excel…")
+        out_path = wide_to_long_from_excel(
+            path,
+            header_cell=header_rc,
+            sheet_name=sheet_name,
+            id_col_name=id_col_name,
+            var_name=var_name,
+            value_name=value_name,
+            progress=report,
+            all_sheets=all_sheets,
+        )
+
+        report(100, "完成。")
+        msg_queue.put(("succeeded", str(out_path)))
+    except Exception as e:
+        tb = traceback.format_exc()
+        msg_queue.put(("failed", f"{type(e).__name__}: {e}\n\n{tb}"))
+
+
+class ConvertWorker(QtCore.QObject):
     progressed = QtCore.pyqtSignal(int)
     logged = QtCore.pyqtSignal(str)
     failed = QtCore.pyqtSignal(str)
     succeeded = QtCore.pyqtSignal(str)
+    finished = QtCore.pyqtSignal()
+
+    POLL_MS = 100
 
-    def __init__(self, path, header_cell, sheet_name, id_col_name, var_name, value_name):
+    def __init__(self, path, header_rc, sheet_name, id_col_name, var_name, value_name, all_sheets=False):
         super().__init__()
         self.path = Path(path)
-        self.header_cell = header_cell
+        self.header_rc = header_rc
         self.sheet_name = sheet_name or None
         self.id_col_name = id_col_name or None
         self.var_name = var_name or "variable"
         self.value_name = value_name or "value"
-
-    def run(self):
-        try:
-            self.progressed.emit(5)
-            self.logged.emit("开始处理…")
-            if not self.path.exists():
-                raise FileNotFoundError(f"找不到文件: {self.path}")
-
-            if not A1_REGEX.match(self.header_cell):
-                raise ValueError(f"header_cell 格式不合法：{self.header_cell}（示例：A5、BC10）")
-
-            self.progressed.emit(20)
-            self.logged.emit("读取 Excel…")
-            out_path = wide_to_long_from_excel(
-                self.path,
-                header_cell=self.header_cell,
-                sheet_name=self.sheet_name,
-                id_col_name=self.id_col_name,
-                var_name=self.var_name,
-                value_name=self.value_name,
-            )
-
-            self.progressed.emit(90)
-            self.logged.emit("写出结果…")
-            self.progressed.emit(100)
-            self.logged.emit("完成。")
-            self.succeeded.emit(str(out_path))
-        except Exception as e:
-            tb = traceback.format_exc()
-            self.failed.emit(f"{type(e).__name__}: {e}\n\n{tb}")
+        self.all_sheets = all_sheets
+
+        self._proc = None
+        self._queue = None
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(self.POLL_MS)
+        self._timer.timeout.connect(self._poll)
+
+    def start(self):
+        # spawn 而非 fork：子进程不继承 Qt 的线程/窗口状态
+        ctx = multiprocessing.get_context("spawn")
+        self._queue = ctx.Queue()
+        self._proc = ctx.Process(
+            target=_convert_in_child,
+            args=(
+                self._queue, str(self.path), self.header_rc, self.sheet_name,
+                self.id_col_name, self.var_name, self.value_name, self.all_sheets,
+            ),
+            daemon=True,
+        )
+        self._proc.start()
+        self._timer.start()
+
+    def _poll(self):
+        alive = self._proc.is_alive()
+        while True:
+            try:
+                msg = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            kind = msg[0]
+            if kind == "progress":
+                self.progressed.emit(msg[1])
+                self.logged.emit(msg[2])
+            elif kind == "succeeded":
+                self.succeeded.emit(msg[1])
+                return self._finish()
+            elif kind == "failed":
+                self.failed.emit(msg[1])
+                return self._finish()
+
+        if not alive:
+            self.failed.emit(f"处理进程异常退出（exitcode={self._proc.exitcode}）")
+            self._finish()
+
+    def _finish(self):
+        self._timer.stop()
+        self._proc.join()
+        self._queue.close()
+        self.finished.emit()
 
 
 # ========= 主界面 =========
@@ -212,7 +498,13 @@ class MainWindow(QtWidgets.QWidget):
         # 工作表名
         self.ed_sheet = QtWidgets.QLineEdit()
         self.ed_sheet.setPlaceholderText("留空表示活动工作表")
-        form.addRow("工作表名（可选）：", self.ed_sheet)
+        self.chk_all_sheets = QtWidgets.QCheckBox("全部工作表")
+        self.chk_all_sheets.setToolTip("逐表转换后合并输出，并增加 sheet 列")
+        self.chk_all_sheets.toggled.connect(lambda on: self.ed_sheet.setEnabled(not on))
+        sheet_row = QtWidgets.QHBoxLayout()
+        sheet_row.addWidget(self.ed_sheet, 1)
+        sheet_row.addWidget(self.chk_all_sheets)
+        form.addRow("工作表名（可选）：", sheet_row)
 
         # ID 列名
         self.ed_id = QtWidgets.QLineEdit()
@@ -309,6 +601,7 @@ class MainWindow(QtWidgets.QWidget):
         path = self.ed_file.text().strip()
         header = self.ed_header.text().strip() or "A1"
         sheet = self.ed_sheet.text().strip()
+        all_sheets = self.chk_all_sheets.isChecked()
         idcol = self.ed_id.text().strip()
         varname = self.ed_var.text().strip() or "variable"
         valname = self.ed_val.text().strip() or "value"
@@ -320,7 +613,7 @@ class MainWindow(QtWidgets.QWidget):
         if not Path(path).exists():
             self._alert("文件不存在，请重新选择。")
             return
-        if not A1_REGEX.match(header):
+        if not is_a1(header):
             self._alert("表头起点格式不正确（示例：A5、BC10）。")
             return
 
@@ -328,8 +621,8 @@ class MainWindow(QtWidgets.QWidget):
         self.progress.setValue(0)
         self.btn_run.setEnabled(False)
 
-        # 后台线程
-        self.worker = ConvertWorker(path, header, sheet, idcol, varname, valname)
+        # 后台工作进程
+        self.worker = ConvertWorker(path, a1_to_rc(header), sheet, idcol, varname, valname, all_sheets)
         self.worker.progressed.connect(self.progress.setValue)
         self.worker.logged.connect(self._log)
         self.worker.failed.connect(self._failed)
@@ -366,4 +659,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()  # PyInstaller 打包后子进程启动需要
     main()